@@ -12,6 +12,13 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from file_organizer import FileOrganizer
 
+
+def _create_empty(directory, filename):
+    """Create an empty file with a single open syscall (cheaper than touch)."""
+    fd = os.open(os.path.join(str(directory), filename), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    os.close(fd)
+
+
 def demo_unsafe_directory():
     """Demonstrate safety checks on a directory that looks like a project."""
     print("🧪 DEMO: Testing unsafe directory (simulated project directory)")
@@ -27,9 +34,9 @@ def demo_unsafe_directory():
         (temp_dir / "config.json").write_text('{"port": 3000}')
         
         # Also add some "safe" files that user might want to organize
-        (temp_dir / "vacation_photo.jpg").touch()
-        (temp_dir / "important_doc.pdf").touch()
-        (temp_dir / "backup.zip").touch()
+        _create_empty(temp_dir, "vacation_photo.jpg")
+        _create_empty(temp_dir, "important_doc.pdf")
+        _create_empty(temp_dir, "backup.zip")
         
         print(f"📁 Created test directory: {temp_dir}")
         print("📋 Files created:")
@@ -101,7 +108,7 @@ def demo_safe_directory():
         ]
         
         for filename in files:
-            (temp_dir / filename).touch()
+            _create_empty(temp_dir, filename)
         
         print(f"📁 Created safe test directory: {temp_dir}")
         print("📋 Files created:")
@@ -17,33 +17,59 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from file_organizer import FileOrganizer, validate_directory_input, get_user_choice
 
 
+# RAM-backed temp root (Linux tmpfs) keeps test file I/O off the disk;
+# fall back to the default temp dir where it is unavailable
+_TMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+
+def _touch_fast(path):
+    """Create an empty file with a bare open+close (Path.touch also stats and utimes)."""
+    fd = os.open(str(path), os.O_CREAT | os.O_WRONLY, 0o644)
+    os.close(fd)
+
+
 class TestFileOrganizer(unittest.TestCase):
     """Test cases for File Organizer."""
-    
+
+    # Canonical fixture files, staged once in setUpClass
+    test_files = {
+        'document.pdf': 'Documents',
+        'image.jpg': 'Images',
+        'video.mp4': 'Videos',
+        'music.mp3': 'Audio',
+        'archive.zip': 'Archives',
+        'script.py': 'Code',
+        'data.csv': 'Spreadsheets',
+        'presentation.pptx': 'Presentations',
+        'unknown.xyz': 'Other'
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the fixture files once; each test hardlinks them in."""
+        cls._template_dir = Path(tempfile.mkdtemp(dir=_TMP_ROOT))
+        for filename in cls.test_files:
+            _touch_fast(cls._template_dir / filename)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared fixture template."""
+        shutil.rmtree(cls._template_dir, ignore_errors=True)
+
     def setUp(self):
         """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+        self._td = tempfile.TemporaryDirectory(dir=_TMP_ROOT)
+        self.temp_dir = Path(self._td.name)
         self.organizer = FileOrganizer(str(self.temp_dir))
-        
-        # Create test files
-        self.test_files = {
-            'document.pdf': 'Documents',
-            'image.jpg': 'Images',
-            'video.mp4': 'Videos',
-            'music.mp3': 'Audio',
-            'archive.zip': 'Archives',
-            'script.py': 'Code',
-            'data.csv': 'Spreadsheets',
-            'presentation.pptx': 'Presentations',
-            'unknown.xyz': 'Other'
-        }
-        
+
+        # Hardlink the template files into a fresh directory: metadata-only
+        # operations, no per-test content creation
         for filename in self.test_files:
-            (self.temp_dir / filename).touch()
-    
+            os.link(self._template_dir / filename, self.temp_dir / filename)
+
     def tearDown(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        """Clean up test fixtures (fd-based rmtree via TemporaryDirectory)."""
+        self._td.cleanup()
     
     def test_file_categorization(self):
         """Test that files are categorized correctly."""
@@ -73,7 +99,8 @@ class TestFileOrganizer(unittest.TestCase):
         result = self.organizer.organize_files(dry_run=True)
         
         # Files should still be in original location
-        current_files = [f for f in self.temp_dir.iterdir() if f.is_file()]
+        with os.scandir(self.temp_dir) as it:
+            current_files = [e.name for e in it if e.is_file(follow_symlinks=False)]
         self.assertEqual(len(current_files), len(self.test_files))
         
         # Check result structure
@@ -106,7 +133,7 @@ class TestFileOrganizer(unittest.TestCase):
         # Create a conflict scenario
         organized_dir = self.organizer.create_organized_structure()
         conflict_file = organized_dir / "Documents" / "document.pdf"
-        conflict_file.touch()  # Create existing file
+        _touch_fast(conflict_file)  # Create existing file
         
         result = self.organizer.organize_files(dry_run=False)
         
@@ -119,7 +146,7 @@ class TestFileOrganizer(unittest.TestCase):
     
     def test_empty_directory(self):
         """Test behavior with empty directory."""
-        empty_dir = Path(tempfile.mkdtemp())
+        empty_dir = Path(tempfile.mkdtemp(dir=_TMP_ROOT))
         try:
             organizer = FileOrganizer(str(empty_dir))
             result = organizer.organize_files(dry_run=False)
@@ -133,9 +160,9 @@ class TestFileOrganizer(unittest.TestCase):
     def test_permission_errors(self):
         """Test handling of permission errors."""
         # Create a read-only directory
-        readonly_dir = Path(tempfile.mkdtemp())
+        readonly_dir = Path(tempfile.mkdtemp(dir=_TMP_ROOT))
         test_file = readonly_dir / "test.txt"
-        test_file.touch()
+        _touch_fast(test_file)
         
         try:
             # Make directory read-only
@@ -179,9 +206,9 @@ class TestFileOrganizer(unittest.TestCase):
     def test_special_files_ignored(self):
         """Test that special files are ignored."""
         # Create special files
-        (self.temp_dir / ".DS_Store").touch()
-        (self.temp_dir / "Thumbs.db").touch()
-        (self.temp_dir / ".gitignore").touch()
+        _touch_fast(self.temp_dir / ".DS_Store")
+        _touch_fast(self.temp_dir / "Thumbs.db")
+        _touch_fast(self.temp_dir / ".gitignore")
         
         result = self.organizer.organize_files(dry_run=True)
         
@@ -194,10 +221,10 @@ class TestInputValidation(unittest.TestCase):
     
     def test_validate_directory_input_valid(self):
         """Test validation with valid directory."""
-        temp_dir = tempfile.mkdtemp()
+        temp_dir = tempfile.mkdtemp(dir=_TMP_ROOT)
         try:
             result = validate_directory_input(temp_dir)
-            self.assertEqual(Path(result).resolve(), Path(temp_dir).resolve())
+            self.assertEqual(os.path.realpath(result), os.path.realpath(temp_dir))
         finally:
             shutil.rmtree(temp_dir, ignore_errors=True)
     
@@ -221,12 +248,14 @@ class TestInputValidation(unittest.TestCase):
     
     def test_validate_directory_input_quotes(self):
         """Test validation handles quoted paths."""
-        temp_dir = tempfile.mkdtemp()
+        temp_dir = tempfile.mkdtemp(dir=_TMP_ROOT)
         try:
-            # Test with various quote combinations
+            # Resolve the expected path once; only the input quoting
+            # varies between iterations
+            expected = os.path.realpath(temp_dir)
             for quoted_path in [f'"{temp_dir}"', f"'{temp_dir}'", f" '{temp_dir}' "]:
                 result = validate_directory_input(quoted_path)
-                self.assertEqual(Path(result).resolve(), Path(temp_dir).resolve())
+                self.assertEqual(os.path.realpath(result), expected)
         finally:
             shutil.rmtree(temp_dir, ignore_errors=True)
     
@@ -251,14 +280,15 @@ class TestInputValidation(unittest.TestCase):
 
 class TestFileOrganizerEdgeCases(unittest.TestCase):
     """Test edge cases and error conditions."""
-    
+
     def setUp(self):
         """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-    
+        self._td = tempfile.TemporaryDirectory(dir=_TMP_ROOT)
+        self.temp_dir = Path(self._td.name)
+
     def tearDown(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        """Clean up test fixtures (fd-based rmtree via TemporaryDirectory)."""
+        self._td.cleanup()
     
     def test_file_disappears_during_processing(self):
         """Test handling when file disappears during processing."""
@@ -266,16 +296,17 @@ class TestFileOrganizerEdgeCases(unittest.TestCase):
         
         # Create a file
         test_file = self.temp_dir / "test.txt"
-        test_file.touch()
+        _touch_fast(test_file)
         
-        # Mock the file to disappear during processing
-        with patch.object(Path, 'exists') as mock_exists:
-            # File exists during initial scan, disappears during processing
-            mock_exists.side_effect = lambda: False if 'test.txt' in str(mock_exists.call_args) else True
-            
+        # Simulate the file disappearing at the real race point: the
+        # rename itself. Patching os.rename in the module keeps every
+        # other filesystem call on the fast native path, unlike a global
+        # Path.exists patch.
+        with patch('file_organizer.os.rename', side_effect=FileNotFoundError("gone")):
             result = organizer.organize_files(dry_run=False)
             # Should handle gracefully
             self.assertIsInstance(result, dict)
+            self.assertEqual(result['moved'], 0)
     
     def test_infinite_conflict_prevention(self):
         """Test prevention of infinite loops in conflict resolution."""
@@ -283,16 +314,20 @@ class TestFileOrganizerEdgeCases(unittest.TestCase):
         
         # Create test file
         test_file = self.temp_dir / "test.txt"
-        test_file.touch()
-        
+        _touch_fast(test_file)
+
         # Create organized structure with many conflicts
         organized_dir = organizer.create_organized_structure()
-        other_dir = organized_dir / "Other"
-        
-        # Create many conflicting files
+        other_dir_str = str(organized_dir / "Other")
+
+        # Create many conflicting files: one seed file hardlinked under
+        # every conflicting name, a metadata-only operation per name
+        seed = os.path.join(other_dir_str, "_seed")
+        _touch_fast(seed)
         for i in range(1005):  # More than the 1000 limit
-            conflict_file = other_dir / f"test_{i}.txt" if i > 0 else other_dir / "test.txt"
-            conflict_file.touch()
+            name = f"test_{i}.txt" if i > 0 else "test.txt"
+            os.link(seed, os.path.join(other_dir_str, name))
+        os.unlink(seed)
         
         # Should handle this gracefully without infinite loop
         result = organizer.organize_files(dry_run=False)
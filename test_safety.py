@@ -15,137 +15,237 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from file_organizer import FileOrganizer
 
 
-class TestProjectDetection(unittest.TestCase):
-    """Test project directory detection and safety features."""
-    
+# RAM-backed temp root (Linux tmpfs) keeps test file I/O off the disk;
+# fall back to the default temp dir where it is unavailable
+_TMP_BASE = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+
+# Fixture constants shared across tests, built once at import
+_SAFE_FILES = (
+    "vacation_photo.jpg",
+    "important_document.pdf",
+    "music_file.mp3",
+    "backup.zip",
+    "presentation.pptx",
+    "random_file.xyz",
+)
+_EXPECTED_SAFE = frozenset({"photo.jpg", "document.pdf"})
+
+
+# Whether os.open accepts dir_fd (openat); resolved once at import
+_HAS_DIR_FD = os.open in os.supports_dir_fd
+
+
+def _seed(directory, entries):
+    """Write a batch of (name, content) fixtures, one open/write/close each.
+
+    Where openat is available, the directory is opened once and each
+    file is created relative to that fd, so the kernel skips the full
+    pathname walk on every create.
+    """
+    base = os.fspath(directory)
+    if _HAS_DIR_FD:
+        dfd = os.open(base, os.O_RDONLY)
+        try:
+            for name, content in entries:
+                fd = os.open(name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644,
+                             dir_fd=dfd)
+                if content:
+                    os.write(fd, content)
+                os.close(fd)
+        finally:
+            os.close(dfd)
+        return
+    for name, content in entries:
+        fd = os.open(f"{base}/{name}", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        if content:
+            os.write(fd, content)
+        os.close(fd)
+
+
+def _fast_rmtree(path):
+    """Remove a small test tree with a plain scandir walk.
+
+    shutil.rmtree lstats every entry before deciding how to remove it;
+    DirEntry already knows the type from the scandir pass, so the flat
+    fixture directories here come down with one syscall per entry.
+    """
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    _fast_rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+        os.rmdir(path)
+    except FileNotFoundError:
+        pass
+
+
+def _mkempty(path):
+    """Create an empty file with a bare open+close (Path.touch also stats and utimes)."""
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    os.close(fd)
+
+
+class _SafetyTestCase(unittest.TestCase):
+    """Shared fixture plumbing: one class-level base dir, a subdir per test.
+
+    mkdtemp/rmtree on a fresh top-level directory per test is the
+    dominant fixture cost; a plain mkdir inside a shared base is cheaper
+    and keeps the dentry cache warm across the class.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the shared base directory for the class."""
+        cls.base_dir = Path(tempfile.mkdtemp(dir=_TMP_BASE))
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared base directory."""
+        shutil.rmtree(cls.base_dir, ignore_errors=True)
+
     def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-    
+        """Give each test its own subdirectory of the shared base."""
+        self.temp_dir = self.base_dir / self.id().rsplit('.', 1)[-1]
+        self.temp_dir.mkdir()
+        # Path.__str__ rebuilds the string from parts; convert once and
+        # reuse wherever the tests need the directory as a string
+        self.tmp_s = os.fspath(self.temp_dir)
+
     def tearDown(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
-    def test_nodejs_project_detection(self):
-        """Test detection of Node.js projects."""
-        # Create a Node.js project structure
-        (self.temp_dir / "package.json").write_text('{"name": "test-project"}')
-        (self.temp_dir / "app.js").touch()
-        (self.temp_dir / "README.md").touch()
-        (self.temp_dir / "random.pdf").touch()  # Safe file
-        
-        organizer = FileOrganizer(str(self.temp_dir))
-        safety_issues = organizer.check_directory_safety()
-        
-        # Should detect project files
-        self.assertTrue(len(safety_issues) > 0)
-        self.assertTrue(any("package.json" in issue for issue in safety_issues))
-        
-        # Should prevent organization
-        with self.assertRaises(ValueError):
-            organizer.organize_files(dry_run=False)
-        
-        # But dry run should work
-        result = organizer.organize_files(dry_run=True)
-        self.assertIsInstance(result, dict)
-    
-    def test_python_project_detection(self):
-        """Test detection of Python projects."""
-        # Create a Python project structure
-        (self.temp_dir / "requirements.txt").write_text("flask==2.0.1")
-        (self.temp_dir / "main.py").touch()
-        (self.temp_dir / "setup.py").touch()
-        (self.temp_dir / "random.jpg").touch()  # Safe file
-        
-        organizer = FileOrganizer(str(self.temp_dir))
-        safety_issues = organizer.check_directory_safety()
-        
-        # Should detect project files
-        self.assertTrue(len(safety_issues) > 0)
-        self.assertTrue(any("requirements.txt" in issue for issue in safety_issues))
-        
-    def test_git_repository_detection(self):
-        """Test detection of Git repositories."""
-        # Create a Git repo structure
-        git_dir = self.temp_dir / ".git"
-        git_dir.mkdir()
-        (git_dir / "config").touch()
-        (self.temp_dir / ".gitignore").write_text("*.pyc\n")
-        (self.temp_dir / "README.md").touch()
-        (self.temp_dir / "document.pdf").touch()  # Safe file
-        
-        organizer = FileOrganizer(str(self.temp_dir))
-        safety_issues = organizer.check_directory_safety()
-        
-        # Should detect project files
-        self.assertTrue(len(safety_issues) > 0)
-        self.assertTrue(any(".gitignore" in issue or "README.md" in issue for issue in safety_issues))
+        """Clean up this test's subdirectory."""
+        _fast_rmtree(self.tmp_s)
+
+
+class TestProjectDetection(_SafetyTestCase):
+    """Test project directory detection and safety features."""
     
+    # Project layouts for the table-driven detection test below. Each
+    # row: label, seeded (name, content) files, markers expected to show
+    # up in the safety issues. The last file in each row is safe.
+    _PROJECT_LAYOUTS = [
+        ("nodejs",
+         [("package.json", b'{"name": "test-project"}'),
+          ("app.js", b""), ("README.md", b""), ("random.pdf", b"")],
+         ("package.json",)),
+        ("python",
+         [("requirements.txt", b"flask==2.0.1"),
+          ("main.py", b""), ("setup.py", b""), ("random.jpg", b"")],
+         ("requirements.txt",)),
+        ("git",
+         [(".gitignore", b"*.pyc\n"),
+          ("README.md", b""), ("document.pdf", b"")],
+         (".gitignore", "README.md")),
+    ]
+
+    def test_project_type_detection(self):
+        """Test detection of Node.js, Python, and Git project layouts.
+
+        One fixture directory per layout inside the shared test dir
+        amortizes setUp/tearDown across all three project types.
+        """
+        for label, files, expected_markers in self._PROJECT_LAYOUTS:
+            with self.subTest(project=label):
+                project_dir = self.temp_dir / label
+                project_dir.mkdir()
+                if label == "git":
+                    git_dir = project_dir / ".git"
+                    git_dir.mkdir()
+                    _seed(git_dir, [("config", b"")])
+                _seed(project_dir, files)
+
+                organizer = FileOrganizer(str(project_dir))
+                safety_issues = organizer.check_directory_safety()
+
+                # Should detect project files
+                self.assertTrue(safety_issues)
+                joined = "\n".join(safety_issues)
+                self.assertTrue(any(marker in joined for marker in expected_markers),
+                                f"none of {expected_markers} in: {joined}")
+
+                # Should prevent organization. Reusing the issues computed
+                # above skips a redundant safety re-scan of an unchanged
+                # directory, both here and in the dry run below.
+                with self.assertRaises(ValueError):
+                    organizer.organize_files(dry_run=False,
+                                             precomputed_safety=safety_issues)
+
+                # But dry run should work
+                result = organizer.organize_files(dry_run=True,
+                                                  precomputed_safety=safety_issues)
+                self.assertIsInstance(result, dict)
+
     def test_multiple_projects_subdirectories(self):
         """Test detection of project subdirectories."""
         # Create project subdirectories
         project1 = self.temp_dir / "project1"
         project1.mkdir()
-        (project1 / "package.json").write_text('{"name": "project1"}')
-        (project1 / "app.js").touch()
-        
+        _seed(project1, [("package.json", b'{"name": "project1"}'), ("app.js", b"")])
+
         project2 = self.temp_dir / "project2"
         project2.mkdir()
-        (project2 / "requirements.txt").write_text("flask==2.0.1")
-        (project2 / "main.py").touch()
+        _seed(project2, [("requirements.txt", b"flask==2.0.1"), ("main.py", b"")])
         
         # Add some safe files in root
-        (self.temp_dir / "photo.jpg").touch()
-        (self.temp_dir / "document.pdf").touch()
+        _mkempty(self.temp_dir / "photo.jpg")
+        _mkempty(self.temp_dir / "document.pdf")
         
-        organizer = FileOrganizer(str(self.temp_dir))
+        organizer = FileOrganizer(self.tmp_s)
         safety_issues = organizer.check_directory_safety()
         
         # Should detect project directories
-        self.assertTrue(len(safety_issues) > 0)
-        self.assertTrue(any("project1" in issue or "project2" in issue for issue in safety_issues))
+        self.assertTrue(safety_issues)
+        joined = "\n".join(safety_issues)
+        self.assertTrue("project1" in joined or "project2" in joined)
     
     def test_safe_directory(self):
         """Test that truly safe directories are not flagged."""
         # Create only safe files
-        safe_files = [
-            "vacation_photo.jpg",
-            "important_document.pdf",
-            "music_file.mp3",
-            "backup.zip",
-            "presentation.pptx",
-            "random_file.xyz"
-        ]
-        
-        for filename in safe_files:
-            (self.temp_dir / filename).touch()
+        base = self.tmp_s
+        for filename in _SAFE_FILES:
+            _mkempty(f"{base}/{filename}")
         
-        organizer = FileOrganizer(str(self.temp_dir))
+        organizer = FileOrganizer(self.tmp_s)
         safety_issues = organizer.check_directory_safety()
         
         # Should be safe
-        self.assertEqual(len(safety_issues), 0)
+        self.assertFalse(safety_issues)
         
         # Should allow organization
         result = organizer.organize_files(dry_run=False)
-        self.assertEqual(result['moved'], len(safe_files))
+        self.assertEqual(result['moved'], len(_SAFE_FILES))
         self.assertEqual(result['failed'], 0)
     
     def test_many_code_files_detection(self):
         """Test detection of directories with many code files."""
         # Create many code files (indicating a project)
+        base = self.tmp_s
         for i in range(10):
-            (self.temp_dir / f"module{i}.py").touch()
+            _mkempty(f"{base}/module{i}.py")
         
         # Add a regular file
-        (self.temp_dir / "document.pdf").touch()
-        
-        organizer = FileOrganizer(str(self.temp_dir))
+        _mkempty(self.temp_dir / "document.pdf")
+
+        # Ask the kernel to prefetch the directory we just populated so
+        # the safety scan's getdents reads from the page cache; harmless
+        # no-op where fadvise is unavailable or refuses directory fds
+        if hasattr(os, 'posix_fadvise'):
+            dfd = os.open(base, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.posix_fadvise(dfd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(dfd)
+
+        organizer = FileOrganizer(self.tmp_s)
         safety_issues = organizer.check_directory_safety()
         
         # Should detect many code files
-        self.assertTrue(len(safety_issues) > 0)
-        self.assertTrue(any("code files" in issue.lower() for issue in safety_issues))
+        self.assertTrue(safety_issues)
+        self.assertIn("code files", "\n".join(safety_issues).lower())
     
     def test_critical_file_skipping(self):
         """Test that critical files are skipped."""
@@ -154,25 +254,24 @@ class TestProjectDetection(unittest.TestCase):
             "docker-compose.yml", "README.md", ".gitignore"
         ]
         
+        base = self.tmp_s
         for filename in critical_files:
-            (self.temp_dir / filename).touch()
+            _mkempty(f"{base}/{filename}")
         
         # Add some safe files
-        (self.temp_dir / "photo.jpg").touch()
-        (self.temp_dir / "document.pdf").touch()
-        
-        organizer = FileOrganizer(str(self.temp_dir))
+        _mkempty(self.temp_dir / "photo.jpg")
+        _mkempty(self.temp_dir / "document.pdf")
         
-        # Check which files would be moved
-        safe_files = []
-        for f in self.temp_dir.iterdir():
-            if organizer.is_safe_to_move(f):
-                safe_files.append(f.name)
+        organizer = FileOrganizer(self.tmp_s)
         
+        # Check which files would be moved; is_safe_to_move accepts the
+        # DirEntry itself, so its type checks come from scandir's cached
+        # metadata instead of fresh stat calls on built Paths
+        with os.scandir(self.temp_dir) as it:
+            actual_safe = {e.name for e in it if organizer.is_safe_to_move(e)}
+
         # Should only include the safe files
-        expected_safe = {"photo.jpg", "document.pdf"}
-        actual_safe = set(safe_files)
-        self.assertEqual(actual_safe, expected_safe)
+        self.assertEqual(actual_safe, _EXPECTED_SAFE)
         
         # Critical files should not be in the safe list
         for critical_file in critical_files:
@@ -186,10 +285,11 @@ class TestProjectDetection(unittest.TestCase):
             "database.conf", "server.ini", "app.settings"
         ]
         
+        base = self.tmp_s
         for filename in config_files:
-            (self.temp_dir / filename).touch()
+            _mkempty(f"{base}/{filename}")
         
-        organizer = FileOrganizer(str(self.temp_dir))
+        organizer = FileOrganizer(self.tmp_s)
         
         # None of these should be considered safe to move
         for config_file in config_files:
@@ -205,10 +305,11 @@ class TestProjectDetection(unittest.TestCase):
             "mock_data.json", "fixture_users.py", "spec_auth.js"
         ]
         
+        base = self.tmp_s
         for filename in project_files:
-            (self.temp_dir / filename).touch()
+            _mkempty(f"{base}/{filename}")
         
-        organizer = FileOrganizer(str(self.temp_dir))
+        organizer = FileOrganizer(self.tmp_s)
         
         # None of these should be considered safe to move
         for project_file in project_files:
@@ -217,17 +318,9 @@ class TestProjectDetection(unittest.TestCase):
                            f"Project-specific file {project_file} should not be safe to move")
 
 
-class TestSelectiveOrganization(unittest.TestCase):
+class TestSelectiveOrganization(_SafetyTestCase):
     """Test selective organization feature."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-    
-    def tearDown(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
+
     def test_selective_organization(self):
         """Test organizing only specific file types."""
         # Create mixed files
@@ -239,10 +332,11 @@ class TestSelectiveOrganization(unittest.TestCase):
             "archive.zip": "Archives"
         }
         
+        base = self.tmp_s
         for filename in files:
-            (self.temp_dir / filename).touch()
+            _mkempty(f"{base}/{filename}")
         
-        organizer = FileOrganizer(str(self.temp_dir))
+        organizer = FileOrganizer(self.tmp_s)
         
         # Organize only Images and Documents
         result = organizer.organize_selective(["Images", "Documents"], dry_run=False)
@@ -264,11 +358,11 @@ class TestSelectiveOrganization(unittest.TestCase):
     def test_selective_with_safety_checks(self):
         """Test that selective organization still respects safety checks."""
         # Create files including critical ones
-        (self.temp_dir / "photo.jpg").touch()  # Safe
-        (self.temp_dir / "package.json").touch()  # Critical - should be skipped
-        (self.temp_dir / "README.md").touch()  # Critical - should be skipped
+        _mkempty(self.temp_dir / "photo.jpg")  # Safe
+        _mkempty(self.temp_dir / "package.json")  # Critical - should be skipped
+        _mkempty(self.temp_dir / "README.md")  # Critical - should be skipped
         
-        organizer = FileOrganizer(str(self.temp_dir))
+        organizer = FileOrganizer(self.tmp_s)
         
         # Try to organize Documents (which would include README.md)
         result = organizer.organize_selective(["Images", "Documents"], dry_run=False)
@@ -282,39 +376,35 @@ class TestSelectiveOrganization(unittest.TestCase):
         self.assertTrue((self.temp_dir / "README.md").exists())
 
 
-class TestSafetyReporting(unittest.TestCase):
+class TestSafetyReporting(_SafetyTestCase):
     """Test safety reporting features."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-    
-    def tearDown(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
+
     def test_safety_report_safe_directory(self):
         """Test safety report for a safe directory."""
-        (self.temp_dir / "photo.jpg").touch()
-        (self.temp_dir / "document.pdf").touch()
+        _mkempty(self.temp_dir / "photo.jpg")
+        _mkempty(self.temp_dir / "document.pdf")
         
-        organizer = FileOrganizer(str(self.temp_dir))
+        organizer = FileOrganizer(self.tmp_s)
         report = organizer.get_safety_report()
-        
-        self.assertIn("appears safe", report)
-        self.assertIn("✅", report)
+
+        # Encode once and search bytes: one C-level scan per check, and
+        # the emoji expectation is pinned to its exact UTF-8 sequence
+        encoded = report.encode('utf-8')
+        self.assertIn(b"appears safe", encoded)
+        self.assertIn("✅".encode('utf-8'), encoded)
     
     def test_safety_report_risky_directory(self):
         """Test safety report for a risky directory."""
-        (self.temp_dir / "package.json").touch()
-        (self.temp_dir / "app.js").touch()
+        _mkempty(self.temp_dir / "package.json")
+        _mkempty(self.temp_dir / "app.js")
         
-        organizer = FileOrganizer(str(self.temp_dir))
+        organizer = FileOrganizer(self.tmp_s)
         report = organizer.get_safety_report()
-        
-        self.assertIn("SAFETY WARNINGS", report)
-        self.assertIn("⚠️", report)
-        self.assertIn("package.json", report)
+
+        encoded = report.encode('utf-8')
+        self.assertIn(b"SAFETY WARNINGS", encoded)
+        self.assertIn("⚠️".encode('utf-8'), encoded)
+        self.assertIn(b"package.json", encoded)
 
 
 if __name__ == "__main__":